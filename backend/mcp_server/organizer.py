@@ -1,6 +1,7 @@
 
 import os
 import io
+import asyncio
 import json
 import base64
 import shutil
@@ -19,7 +20,7 @@ from pydantic import BaseModel,Field
 from mcp.server.fastmcp import FastMCP
 from agno.agent import Agent
 from agno.models.groq import Groq
-from PyPDF2 import PdfReader
+from mcp_server.pdf_worker import extract_pdf_text
 from dotenv import load_dotenv
 load_dotenv()
 DEFAULT_CREDENTIALS_PATH = "mcp_server/mcp_server_helper/credentials.json"
@@ -35,19 +36,10 @@ SCOPES = [
 class FolderSelecter(BaseModel):
     folder_name: str = Field(description="Name of the folder to select")
     folder_id: str = Field(description="ID of the folder to select")
-def extract_pdf_text(pdf_path: str) -> str:
-    reader = PdfReader(pdf_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() or ""
-    return text.strip()
-
 def folder_selector_ai(
-    pdf_path: str,
+    pdf_text: str,
     folders: list[dict]
 ) -> FolderSelecter:
-    pdf_text = extract_pdf_text(pdf_path)
-
     agent = Agent(
         model=Groq(
             id="openai/gpt-oss-120b",
@@ -157,8 +149,9 @@ def file_upload(filepath: str, folder_id: str=None) -> str:
 
 async def main(pdf_path: str):
     file_listing()
+    pdf_text = await asyncio.to_thread(extract_pdf_text, pdf_path)
     res=folder_selector_ai(
-        pdf_path=pdf_path,
+        pdf_text=pdf_text,
         folders=file_listing()
     )
     file_upload(
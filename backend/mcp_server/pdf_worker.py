@@ -0,0 +1,146 @@
+import os
+import sys
+import json
+import time
+import threading
+import subprocess
+
+
+def _available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# PDF_WORKERS x PDF_MEMORY_LIMIT_MB is the worst case the host must absorb.
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", min(2, _available_cpus())))
+PDF_TIMEOUT_SECONDS = float(os.getenv("PDF_TIMEOUT_SECONDS", "30"))
+PDF_MEMORY_LIMIT_MB = int(os.getenv("PDF_MEMORY_LIMIT_MB", "256"))
+PDF_STARTUP_TIMEOUT_SECONDS = 30
+
+if PDF_WORKERS <= 0:
+    raise ValueError(f"PDF_WORKERS must be at least 1, got {PDF_WORKERS}")
+
+# Workers run as `python -m mcp_server.pdf_worker` from the backend directory,
+# so they never re-import the server's entry script.
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_READY = b"ready\n"
+
+_slots = threading.BoundedSemaphore(PDF_WORKERS)
+
+
+def _limit_memory(limit_mb: int) -> None:
+    try:
+        import resource
+    except ImportError:
+        # No rlimits on Windows; the timeout still applies.
+        return
+    limit = limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        # Some platforms (e.g. macOS) refuse RLIMIT_AS; fall back to timeout only.
+        pass
+
+
+def _worker_command(memory_limit_mb: int) -> list[str]:
+    return [sys.executable, "-m", "mcp_server.pdf_worker", str(memory_limit_mb)]
+
+
+def _serve(memory_limit_mb: int) -> None:
+    """Worker entry point: report ready, read one path from stdin, reply with JSON."""
+    from PyPDF2 import PdfReader
+
+    _limit_memory(memory_limit_mb)
+    out = sys.stdout.buffer
+    out.write(_READY)
+    out.flush()
+
+    pdf_path = os.fsdecode(sys.stdin.buffer.read())
+    try:
+        reader = PdfReader(pdf_path)
+        text = ""
+        for page in reader.pages:
+            text += page.extract_text() or ""
+        reply = {"status": "ok", "text": text.strip()}
+    except Exception as e:
+        reply = {"status": "error", "message": f"{type(e).__name__}: {e}"}
+    out.write(json.dumps(reply).encode("utf-8"))
+    out.flush()
+
+
+def _stderr_tail(stderr: bytes, lines: int = 5) -> str:
+    tail = stderr.decode("utf-8", "replace").strip().splitlines()[-lines:]
+    return ("\n" + "\n".join(tail)) if tail else ""
+
+
+def _run_worker(pdf_path: str, timeout: float, memory_limit_mb: int) -> dict:
+    # The worker runs from the backend directory, so resolve relative paths here.
+    path_bytes = os.fsencode(os.path.abspath(pdf_path))
+    worker = subprocess.Popen(
+        _worker_command(memory_limit_mb),
+        cwd=_BACKEND_DIR,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        # Interpreter start-up is not charged to the document.
+        startup_timer = threading.Timer(PDF_STARTUP_TIMEOUT_SECONDS, worker.kill)
+        startup_timer.start()
+        try:
+            ready = worker.stdout.readline()
+        finally:
+            startup_timer.cancel()
+        if ready != _READY:
+            worker.kill()
+            _, stderr = worker.communicate()
+            raise RuntimeError(
+                f"PDF worker failed to start while parsing {pdf_path}"
+                f"{_stderr_tail(stderr)}"
+            )
+
+        try:
+            output, stderr = worker.communicate(path_bytes, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            raise TimeoutError(
+                f"PDF parsing timed out after {timeout}s: {pdf_path}"
+            ) from None
+    finally:
+        if worker.poll() is None:
+            worker.kill()
+        worker.wait()
+
+    if not output:
+        raise RuntimeError(
+            f"PDF worker exited unexpectedly while parsing {pdf_path}"
+            f"{_stderr_tail(stderr)}"
+        )
+    return json.loads(output)
+
+
+def extract_pdf_text(pdf_path: str,
+                     timeout: float = PDF_TIMEOUT_SECONDS,
+                     memory_limit_mb: int = PDF_MEMORY_LIMIT_MB) -> str:
+    """Extract PDF text in a separate process, at most PDF_WORKERS at a time.
+
+    Each document gets its own worker so a runaway parse can be killed on
+    timeout without affecting other requests. Time spent waiting for a free
+    worker slot counts against `timeout`.
+    """
+    started = time.monotonic()
+    if not _slots.acquire(timeout=timeout):
+        raise TimeoutError(f"No PDF worker free after {timeout}s: {pdf_path}")
+    try:
+        remaining = max(timeout - (time.monotonic() - started), 0)
+        reply = _run_worker(pdf_path, remaining, memory_limit_mb)
+    finally:
+        _slots.release()
+
+    if reply["status"] == "error":
+        raise RuntimeError(f"Failed to parse PDF {pdf_path}: {reply['message']}")
+    return reply["text"]
+
+
+if __name__ == "__main__":
+    _serve(int(sys.argv[1]))
@@ -0,0 +1,113 @@
+import sys
+import zlib
+
+import pytest
+
+pytest.importorskip("PyPDF2")
+
+from PyPDF2 import PdfReader
+from mcp_server import pdf_worker
+from mcp_server.pdf_worker import extract_pdf_text
+
+
+def _spaces_stream(megabytes: int) -> bytes:
+    """Compress `megabytes` MB of spaces without holding them all in memory."""
+    compressor = zlib.compressobj()
+    chunk = b" " * (1024 * 1024)
+    packed = b"".join(compressor.compress(chunk) for _ in range(megabytes))
+    return packed + compressor.flush()
+
+
+def _write_pdf(path, text: str = "Hello PDF", pages: int = 1, packed: bytes = None) -> str:
+    """Write a minimal PDF whose pages all share one content stream."""
+    if packed is None:
+        content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        stream_obj = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+    else:
+        stream_obj = (b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(packed)
+                      + packed + b"\nendstream")
+
+    first_page = 5
+    kids = " ".join(f"{first_page + i} 0 R" for i in range(pages))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        stream_obj,
+    ]
+    objects += [
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 3 0 R >> >> /Contents 4 0 R >>"
+    ] * pages
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(body)
+    body += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    body += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    body += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(body)
+    return str(path)
+
+
+def test_matches_inline_pypdf2(tmp_path):
+    pdf_path = _write_pdf(tmp_path / "hello.pdf")
+    reader = PdfReader(pdf_path)
+    expected = "".join(page.extract_text() or "" for page in reader.pages).strip()
+
+    assert extract_pdf_text(pdf_path) == expected
+    assert "Hello PDF" in expected
+
+
+def test_relative_path_resolves_from_caller_cwd(tmp_path, monkeypatch):
+    _write_pdf(tmp_path / "hello.pdf")
+    monkeypatch.chdir(tmp_path)
+    assert "Hello PDF" in extract_pdf_text("hello.pdf")
+
+
+def test_missing_file_raises_runtime_error(tmp_path):
+    with pytest.raises(RuntimeError, match="FileNotFoundError"):
+        extract_pdf_text(str(tmp_path / "missing.pdf"))
+
+
+def test_non_pdf_raises_runtime_error(tmp_path):
+    not_pdf = tmp_path / "notes.pdf"
+    not_pdf.write_text("just some text")
+    with pytest.raises(RuntimeError, match="Failed to parse PDF"):
+        extract_pdf_text(str(not_pdf))
+
+
+def test_slow_document_times_out(tmp_path):
+    pdf_path = _write_pdf(tmp_path / "slow.pdf", pages=2000)
+    with pytest.raises(TimeoutError):
+        extract_pdf_text(pdf_path, timeout=0.05)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="RLIMIT_AS is only enforced on Linux")
+def test_oversized_document_hits_memory_cap(tmp_path):
+    # 512 MB of spaces compresses to about half a megabyte.
+    pdf_path = _write_pdf(tmp_path / "bomb.pdf", packed=_spaces_stream(512))
+    with pytest.raises(RuntimeError, match="MemoryError"):
+        extract_pdf_text(pdf_path, memory_limit_mb=128)
+
+
+def test_worker_crash_raises_runtime_error(tmp_path, monkeypatch):
+    crash = "import sys; sys.stdout.write('ready\\n'); sys.stdout.flush(); sys.exit(1)"
+    monkeypatch.setattr(pdf_worker, "_worker_command", lambda _: [sys.executable, "-c", crash])
+    pdf_path = _write_pdf(tmp_path / "hello.pdf")
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        extract_pdf_text(pdf_path)
+
+
+def test_startup_failure_reports_worker_stderr(tmp_path, monkeypatch):
+    broken = "import sys; sys.stderr.write('ModuleNotFoundError: PyPDF2\\n'); sys.exit(1)"
+    monkeypatch.setattr(pdf_worker, "_worker_command", lambda _: [sys.executable, "-c", broken])
+    pdf_path = _write_pdf(tmp_path / "hello.pdf")
+    with pytest.raises(RuntimeError, match="failed to start(.|\\n)*ModuleNotFoundError"):
+        extract_pdf_text(pdf_path)